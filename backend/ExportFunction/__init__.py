@@ -0,0 +1,100 @@
+import logging
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+import azure.functions as func
+from azure.cosmos import CosmosClient
+import sys
+# Fix relative imports by using absolute imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from SharedCode.export_helpers import (
+    DEFAULT_ROW_GROUP_SIZE,
+    EXPORT_FORMATS,
+    query_stored_analysis_results,
+    write_analysis_results,
+)
+
+EXPORT_MIMETYPES = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream"
+}
+
+# Limits that keep each response to a known size: exports must name a bounded
+# processingTime window, and a single row group cannot cover the whole container
+MAX_EXPORT_WINDOW = timedelta(days=31)
+MAX_ROW_GROUP_SIZE = 50000
+
+def main(req: func.HttpRequest) -> func.HttpResponse:
+    logging.info('Export function processed a request.')
+
+    try:
+        export_format = req.params.get('format', 'parquet').lower()
+        if export_format not in EXPORT_FORMATS:
+            return _error_response(f"Unsupported format '{export_format}', expected one of {list(EXPORT_FORMATS)}", 400)
+
+        try:
+            start = _parse_time_param(req.params.get('start'))
+            end = _parse_time_param(req.params.get('end'))
+        except ValueError:
+            return _error_response("start and end must be ISO 8601 timestamps", 400)
+        if start is None or end is None:
+            return _error_response("start and end are required", 400)
+        if not start < end <= start + MAX_EXPORT_WINDOW:
+            return _error_response(f"end must be after start and at most {MAX_EXPORT_WINDOW.days} days later", 400)
+
+        try:
+            row_group_size = int(req.params.get('rowGroupSize', DEFAULT_ROW_GROUP_SIZE))
+        except ValueError:
+            row_group_size = 0
+        if not 1 <= row_group_size <= MAX_ROW_GROUP_SIZE:
+            return _error_response(f"rowGroupSize must be an integer between 1 and {MAX_ROW_GROUP_SIZE}", 400)
+
+        container = get_results_container()
+        items = query_stored_analysis_results(container, start=start, end=end, page_size=row_group_size)
+
+        # Results are pulled from Cosmos DB and encoded one row group at a time into a
+        # temporary file. HTTP responses cannot stream, so the finished file is read
+        # back once as the response body.
+        with tempfile.TemporaryFile() as export_file:
+            rows_written = write_analysis_results(items, export_file, export_format=export_format, row_group_size=row_group_size)
+            export_file.seek(0)
+            body = export_file.read()
+
+        return func.HttpResponse(
+            body,
+            status_code=200,
+            mimetype=EXPORT_MIMETYPES[export_format],
+            headers={
+                "Content-Disposition": f'attachment; filename="analysis-results.{export_format}"',
+                "X-Row-Count": str(rows_written)
+            }
+        )
+
+    except Exception as e:
+        logging.error(f"Error exporting analysis results: {str(e)}")
+        return _error_response(str(e), 500)
+
+def get_results_container():
+    """
+    Connect to the Cosmos DB container holding stored analysis results
+    """
+    client = CosmosClient.from_connection_string(os.environ["COSMOSDB_CONNECTION"])
+    database = client.get_database_client(os.environ.get("COSMOSDB_DATABASE", "DocumentAnalysis"))
+    return database.get_container_client(os.environ.get("COSMOSDB_CONTAINER", "Results"))
+
+def _parse_time_param(value):
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    # Compare naive UTC values, matching how processingTime is stored
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+def _error_response(message, status_code):
+    return func.HttpResponse(
+        json.dumps({"error": message}),
+        status_code=status_code,
+        mimetype="application/json"
+    )
@@ -0,0 +1,179 @@
+import ast
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Columnar layout of an exported analysis result. Topics and entities are
+# real list columns so analysts can explode/aggregate them without parsing.
+ANALYSIS_RESULT_SCHEMA = pa.schema([
+    ("id", pa.string()),
+    ("documentName", pa.string()),
+    ("uploadTime", pa.timestamp("us")),
+    ("processingTime", pa.timestamp("us")),
+    ("topics", pa.list_(pa.string())),
+    ("entities", pa.list_(pa.string())),
+    ("summary", pa.string()),
+    ("sentiment", pa.string()),
+    ("confidence_score", pa.float64()),
+])
+
+EXPORT_FORMATS = ("parquet", "arrow")
+DEFAULT_ROW_GROUP_SIZE = 10000
+
+def _as_list(value: Any) -> List[str]:
+    """
+    Coerce a stored topics/entities value back into a list of strings.
+    Flattened results store lists as their str() representation.
+    """
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [str(item) for item in value]
+    if isinstance(value, str):
+        try:
+            parsed = ast.literal_eval(value)
+            if isinstance(parsed, (list, tuple)):
+                return [str(item) for item in parsed]
+        except Exception:
+            # literal_eval can also raise TypeError, RecursionError or MemoryError on malformed values
+            pass
+        return [item.strip() for item in value.split(',') if item.strip()]
+    return [str(value)]
+
+def _as_timestamp(value: Any) -> Optional[datetime]:
+    """
+    Parse an ISO 8601 value into a naive UTC datetime, or None if it cannot be parsed.
+    """
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            logging.warning(f"Unparseable timestamp '{value}', exporting as null")
+            return None
+    else:
+        return None
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+def _as_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+def analysis_results_to_record_batch(items: List[Dict[str, Any]]) -> pa.RecordBatch:
+    """
+    Convert a list of stored analysis result documents into a single Arrow record batch.
+
+    Args:
+        items: Stored result documents (as produced by AnalysisFunction)
+
+    Returns:
+        A record batch matching ANALYSIS_RESULT_SCHEMA
+    """
+    columns = {name: [] for name in ANALYSIS_RESULT_SCHEMA.names}
+    for item in items:
+        analysis = item.get("analysisResult") or {}
+        columns["id"].append(item.get("id"))
+        columns["documentName"].append(item.get("documentName"))
+        columns["uploadTime"].append(_as_timestamp(item.get("uploadTime")))
+        columns["processingTime"].append(_as_timestamp(item.get("processingTime")))
+        columns["topics"].append(_as_list(analysis.get("topics")))
+        columns["entities"].append(_as_list(analysis.get("entities")))
+        columns["summary"].append(analysis.get("summary", ""))
+        columns["sentiment"].append(analysis.get("sentiment", "neutral"))
+        columns["confidence_score"].append(_as_float(analysis.get("confidence_score", 0.0)))
+
+    return pa.RecordBatch.from_pydict(columns, schema=ANALYSIS_RESULT_SCHEMA)
+
+def _chunked(items: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def write_analysis_results(items: Iterable[Dict[str, Any]], sink: Any, export_format: str = "parquet",
+                           row_group_size: int = DEFAULT_ROW_GROUP_SIZE) -> int:
+    """
+    Stream analysis results into a Parquet file or Arrow IPC stream, one row group at a time.
+    Only a single row group of results is held in memory at once.
+
+    Args:
+        items: Iterable of stored result documents (may be a lazy query iterator)
+        sink: File path or writable binary file-like object
+        export_format: Either "parquet" or "arrow"
+        row_group_size: Number of results per row group / record batch
+
+    Returns:
+        The number of rows written
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format '{export_format}', expected one of {EXPORT_FORMATS}")
+    if row_group_size < 1:
+        raise ValueError("row_group_size must be a positive integer")
+
+    if export_format == "parquet":
+        writer = pq.ParquetWriter(sink, ANALYSIS_RESULT_SCHEMA)
+    else:
+        writer = pa.ipc.new_stream(sink, ANALYSIS_RESULT_SCHEMA)
+
+    rows_written = 0
+    try:
+        for chunk in _chunked(items, row_group_size):
+            batch = analysis_results_to_record_batch(chunk)
+            if export_format == "parquet":
+                writer.write_batch(batch, row_group_size=row_group_size)
+            else:
+                writer.write_batch(batch)
+            rows_written += batch.num_rows
+    finally:
+        writer.close()
+
+    logging.info(f"Exported {rows_written} analysis results as {export_format}")
+    return rows_written
+
+def query_stored_analysis_results(container: Any, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                                  page_size: int = DEFAULT_ROW_GROUP_SIZE) -> Iterable[Dict[str, Any]]:
+    """
+    Lazily query stored analysis results from a Cosmos DB container, optionally
+    restricted to results processed in the half-open range [start, end).
+
+    Args:
+        container: An azure.cosmos ContainerProxy for the results collection
+        start: Inclusive lower bound on processingTime
+        end: Exclusive upper bound on processingTime
+        page_size: Maximum items fetched per round trip
+
+    Returns:
+        An iterator over result documents, fetched page by page
+    """
+    conditions = []
+    parameters = []
+    if start is not None:
+        conditions.append("c.processingTime >= @start")
+        parameters.append({"name": "@start", "value": _as_timestamp(start).isoformat()})
+    if end is not None:
+        conditions.append("c.processingTime < @end")
+        parameters.append({"name": "@end", "value": _as_timestamp(end).isoformat()})
+
+    query = "SELECT * FROM c"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+
+    return container.query_items(
+        query=query,
+        parameters=parameters,
+        enable_cross_partition_query=True,
+        max_item_count=page_size
+    )
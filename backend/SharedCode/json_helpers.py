@@ -1,6 +1,6 @@
-import json
-import logging
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, List, Optional
+
+from SharedCode.schema_registry import schema_registry
 
 def flatten_nested_json(nested_data: Dict[str, Any], parent_key: str = '', separator: str = '_') -> Dict[str, Any]:
     """
@@ -32,55 +32,29 @@ def flatten_nested_json(nested_data: Dict[str, Any], parent_key: str = '', separ
     
     return dict(items)
 
-def transform_json_response(data: Dict[str, Any]) -> Dict[str, Any]:
+def transform_json_response(data: Dict[str, Any], schema_version: Optional[int] = None) -> Dict[str, Any]:
     """
     Transform a JSON response from Azure OpenAI to a standardized format
     for consistent storage and retrieval.
     
     Args:
         data: The JSON data to transform
+        schema_version: Result schema version to validate against (defaults to the latest)
     
     Returns:
         Transformed JSON with standardized format
     """
-    # Define schema for expected properties
-    expected_schema = {
-        "topics": list,
-        "entities": list,
-        "summary": str,
-        "sentiment": str
-    }
-    
-    # Initialize result with default values
-    result = {
-        "topics": [],
-        "entities": [],
-        "summary": "",
-        "sentiment": "neutral",
-        "confidence_score": 0.0
-    }
-    
-    # Map incoming data to expected schema
-    for key, expected_type in expected_schema.items():
-        if key in data and isinstance(data[key], expected_type):
-            result[key] = data[key]
-        elif key in data:
-            # Type mismatch but key exists, try to convert
-            try:
-                if expected_type == list and isinstance(data[key], str):
-                    # Try to convert string to list by splitting
-                    result[key] = [item.strip() for item in data[key].split(',')]
-                elif expected_type == str and isinstance(data[key], (list, dict)):
-                    # Convert list/dict to string
-                    result[key] = str(data[key])
-                else:
-                    # Default fallback
-                    logging.warning(f"Type mismatch for key '{key}', using default value")
-            except Exception as e:
-                logging.error(f"Error transforming key '{key}': {str(e)}")
+    return schema_registry.normalize(data, schema_version)
+
+def transform_json_responses(responses: List[Dict[str, Any]], schema_version: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Transform a batch of JSON responses from Azure OpenAI in a single validation call.
     
-    # Add additional derived fields if possible
-    if "confidence" in data and isinstance(data["confidence"], (int, float)):
-        result["confidence_score"] = float(data["confidence"])
+    Args:
+        responses: The JSON responses to transform
+        schema_version: Result schema version to validate against (defaults to the latest)
     
-    return result
+    Returns:
+        Transformed responses in the same order as the input
+    """
+    return schema_registry.normalize_batch(responses, schema_version)
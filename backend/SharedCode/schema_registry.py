@@ -0,0 +1,192 @@
+import logging
+import threading
+from collections import Counter
+from functools import partial
+from typing import Annotated, Any, Callable, Dict, Iterable, List, Optional, Type, Union
+
+from pydantic import AfterValidator, ConfigDict, Field, TypeAdapter, ValidationError, ValidationInfo
+from pydantic_core import PydanticUseDefault
+from typing_extensions import TypedDict
+
+def _split_string_to_list(value: str) -> List[str]:
+    # Models sometimes return comma separated strings instead of arrays
+    return [item.strip() for item in value.split(',')]
+
+def _use_default(value: Any, info: ValidationInfo) -> Any:
+    logging.warning(f"Type mismatch for key '{info.field_name}', using default value")
+    if info.context:
+        info.context['record_failure'](info.field_name)
+    raise PydanticUseDefault()
+
+# Last union member of every Coerced* type: anything else falls back to the field default
+_Fallback = Annotated[Any, AfterValidator(_use_default)]
+
+# Reusable field types that apply the same coercions as the original transform_json_response.
+# Each union tries the expected type first, so well-formed values never call into Python,
+# and values that cannot be coerced fall back without raising a ValidationError.
+CoercedList = Annotated[
+    Union[list, Annotated[str, AfterValidator(_split_string_to_list)], _Fallback],
+    Field(union_mode='left_to_right')
+]
+# Models sometimes return a list of points or an object instead of plain text
+CoercedStr = Annotated[
+    Union[str, Annotated[Union[list, dict], AfterValidator(str)], _Fallback],
+    Field(union_mode='left_to_right')
+]
+# Matches the original isinstance(value, (int, float)) check, which also accepts bools
+CoercedFloat = Annotated[
+    Union[float, Annotated[bool, AfterValidator(float)], _Fallback],
+    Field(union_mode='left_to_right')
+]
+
+class ResultSchema(TypedDict):
+    """
+    Base class for versioned analysis result schemas.
+
+    Responses are validated strictly, apart from the coercions built into the
+    Coerced* field types. Fields that cannot be coerced fall back to their
+    default value, and each fallback is counted per field. Subclasses only need to
+    declare their fields, each with a Field default. Schemas are TypedDicts so
+    pydantic-core returns the normalized dicts without building model instances.
+    """
+    __pydantic_config__ = ConfigDict(strict=True, extra='ignore')
+
+class AnalysisResultV1(ResultSchema):
+    """
+    Result schema matching the original prompt: topics, entities, summary and sentiment
+    """
+    topics: Annotated[CoercedList, Field(default_factory=list)]
+    entities: Annotated[CoercedList, Field(default_factory=list)]
+    summary: Annotated[CoercedStr, Field(default="")]
+    sentiment: Annotated[CoercedStr, Field(default="neutral")]
+    confidence_score: Annotated[CoercedFloat, Field(default=0.0, validation_alias='confidence')]
+
+class _CompiledSchema:
+    """
+    A registered schema with its single response and batch validators
+    """
+    def __init__(self, version: int, schema: Type[ResultSchema], record_failure: Callable[[str], None]):
+        self.version = version
+        self.schema = schema
+        self.item_validator = TypeAdapter(schema)
+        self.batch_validator = TypeAdapter(List[schema])
+        # Passed to every validation call so fallbacks inside pydantic-core can be counted
+        self.context = {'record_failure': record_failure}
+
+class SchemaRegistry:
+    """
+    Registry of versioned result schemas. Each schema is compiled into its
+    validators once at registration, so normalizing responses does no per-call setup.
+    """
+    def __init__(self):
+        self._schemas: Dict[int, _CompiledSchema] = {}
+        self._latest: Optional[_CompiledSchema] = None
+        self._failure_counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def register(self, version: int, schema: Type[ResultSchema]) -> None:
+        """
+        Register a result schema under a version number
+
+        Args:
+            version: Schema version, bumped whenever the prompt's output fields change
+            schema: A ResultSchema subclass describing the fields
+        """
+        if version in self._schemas:
+            raise ValueError(f"Result schema version {version} is already registered")
+        self._schemas[version] = _CompiledSchema(version, schema, partial(self._record_failure, version))
+        self._latest = self._schemas[max(self._schemas)]
+
+    @property
+    def latest_version(self) -> int:
+        if self._latest is None:
+            raise LookupError("No result schemas have been registered")
+        return self._latest.version
+
+    def get(self, version: Optional[int] = None) -> Type[ResultSchema]:
+        return self._compiled(version).schema
+
+    def normalize_batch(self, responses: Iterable[Any], version: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Normalize a batch of AI responses against a registered schema in a single validation call
+
+        Args:
+            responses: Parsed JSON responses from Azure OpenAI (any iterable)
+            version: Schema version to validate against (defaults to the latest)
+
+        Returns:
+            A list of normalized result dictionaries, in the same order as the input
+        """
+        compiled = self._compiled(version)
+        if not isinstance(responses, list):
+            responses = list(responses)
+        try:
+            return compiled.batch_validator.validate_python(responses, context=compiled.context)
+        except ValidationError as e:
+            failed_keys: Dict[int, set] = {}
+            for loc in self._error_locations(e):
+                failed_keys.setdefault(loc[0], set()).update(loc[1:2])
+            repaired = [
+                self._drop_failed_fields(compiled, response, failed_keys[index]) if index in failed_keys else response
+                for index, response in enumerate(responses)
+            ]
+            return compiled.batch_validator.validate_python(repaired, context=compiled.context)
+
+    def normalize(self, response: Any, version: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Normalize a single AI response against a registered schema
+        """
+        compiled = self._compiled(version)
+        try:
+            return compiled.item_validator.validate_python(response, context=compiled.context)
+        except ValidationError as e:
+            failed_keys = {loc[0] for loc in self._error_locations(e) if loc}
+            repaired = self._drop_failed_fields(compiled, response, failed_keys)
+            return compiled.item_validator.validate_python(repaired, context=compiled.context)
+
+    def _compiled(self, version: Optional[int]) -> _CompiledSchema:
+        if version is None:
+            if self._latest is None:
+                raise LookupError("No result schemas have been registered")
+            return self._latest
+        if version not in self._schemas:
+            raise LookupError(f"Unknown result schema version {version}")
+        return self._schemas[version]
+
+    @staticmethod
+    def _error_locations(error: ValidationError) -> List[tuple]:
+        return [detail['loc'] for detail in error.errors(include_url=False, include_context=False, include_input=False)]
+
+    def _drop_failed_fields(self, compiled: _CompiledSchema, response: Any, failed_keys: set) -> Dict[str, Any]:
+        # Coerced* fields fall back inside the validators, so this only handles non-object
+        # responses and fields declared with plain types
+        if not isinstance(response, dict):
+            logging.warning(f"Expected a JSON object for analysis result, got {type(response).__name__}, using defaults")
+            self._record_failure(compiled.version, '__root__')
+            return {}
+
+        repaired = dict(response)
+        for key in failed_keys:
+            logging.warning(f"Type mismatch for key '{key}', using default value")
+            self._record_failure(compiled.version, key)
+            repaired.pop(key, None)
+        return repaired
+
+    def _record_failure(self, version: int, field_name: str) -> None:
+        with self._lock:
+            self._failure_counts[(version, field_name)] += 1
+
+    def failure_counts(self) -> Dict[tuple, int]:
+        """
+        Return validation failure counts keyed by (schema version, field name)
+        """
+        with self._lock:
+            return dict(self._failure_counts)
+
+    def reset_failure_counts(self) -> None:
+        with self._lock:
+            self._failure_counts.clear()
+
+# Default registry used by the analysis function
+schema_registry = SchemaRegistry()
+schema_registry.register(1, AnalysisResultV1)
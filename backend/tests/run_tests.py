@@ -3,15 +3,21 @@ import unittest
 def test_suite():
     """Create a test suite with all the test cases"""
     from test_analysis_function import TestAnalysisFunction
+    from test_export_function import TestExportFunction
+    from test_export_helpers import TestExportHelpers
     from test_json_helpers import TestJsonHelpers
     from test_retry_helpers import TestRetryHelpers
+    from test_schema_registry import TestSchemaRegistry
 
     suite = unittest.TestSuite()
     
     # Add all test cases
     suite.addTest(unittest.makeSuite(TestAnalysisFunction))
+    suite.addTest(unittest.makeSuite(TestExportFunction))
+    suite.addTest(unittest.makeSuite(TestExportHelpers))
     suite.addTest(unittest.makeSuite(TestJsonHelpers))
     suite.addTest(unittest.makeSuite(TestRetryHelpers))
+    suite.addTest(unittest.makeSuite(TestSchemaRegistry))
     
     return suite
 
@@ -0,0 +1,129 @@
+import unittest
+import io
+import json
+import azure.functions as func
+from unittest.mock import MagicMock, patch
+import pyarrow.parquet as pq
+import sys
+import os
+
+# Add the parent directory to the path so we can import the function code
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from ExportFunction import main
+
+class TestExportFunction(unittest.TestCase):
+    @patch('ExportFunction.get_results_container')
+    def test_export_parquet_success(self, mock_get_container):
+        # Arrange
+        container = MagicMock()
+        container.query_items.return_value = iter([{
+            "id": "doc-1",
+            "documentName": "test_document.txt",
+            "processingTime": "2024-01-15T12:00:00",
+            "analysisResult": {"topics": "['finance']", "entities": "['revenue']", "sentiment": "positive"}
+        }])
+        mock_get_container.return_value = container
+
+        req = func.HttpRequest(
+            method='GET',
+            body=b'',
+            url='/api/exportResults',
+            params={'start': '2024-01-01T00:00:00Z', 'end': '2024-02-01T00:00:00Z'},
+            route_params={}
+        )
+
+        # Act
+        response = main(req)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['X-Row-Count'], '1')
+        table = pq.read_table(io.BytesIO(response.get_body()))
+        self.assertEqual(table.column("topics").to_pylist(), [["finance"]])
+        parameters = container.query_items.call_args.kwargs["parameters"]
+        self.assertEqual(parameters[0]["value"], "2024-01-01T00:00:00")
+
+    @patch('ExportFunction.get_results_container')
+    def test_export_invalid_time_range(self, mock_get_container):
+        # Arrange
+        req = func.HttpRequest(
+            method='GET',
+            body=b'',
+            url='/api/exportResults',
+            params={'start': 'yesterday'},
+            route_params={}
+        )
+
+        # Act
+        response = main(req)
+        response_body = json.loads(response.get_body())
+
+        # Assert
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue('error' in response_body)
+        mock_get_container.assert_not_called()
+
+    @patch('ExportFunction.get_results_container')
+    def test_export_requires_bounded_time_window(self, mock_get_container):
+        # Arrange
+        invalid_params = [
+            {},
+            {'start': '2024-01-01T00:00:00Z'},
+            {'start': '2024-02-01T00:00:00Z', 'end': '2024-01-01T00:00:00Z'},
+            {'start': '2024-01-01T00:00:00Z', 'end': '2024-06-01T00:00:00Z'}
+        ]
+
+        for params in invalid_params:
+            req = func.HttpRequest(
+                method='GET',
+                body=b'',
+                url='/api/exportResults',
+                params=params,
+                route_params={}
+            )
+
+            # Act
+            response = main(req)
+
+            # Assert
+            self.assertEqual(response.status_code, 400, params)
+        mock_get_container.assert_not_called()
+
+    @patch('ExportFunction.get_results_container')
+    def test_export_row_group_size_is_capped(self, mock_get_container):
+        # Arrange
+        req = func.HttpRequest(
+            method='GET',
+            body=b'',
+            url='/api/exportResults',
+            params={'start': '2024-01-01T00:00:00Z', 'end': '2024-01-02T00:00:00Z', 'rowGroupSize': '1000000000'},
+            route_params={}
+        )
+
+        # Act
+        response = main(req)
+
+        # Assert
+        self.assertEqual(response.status_code, 400)
+        mock_get_container.assert_not_called()
+
+    @patch('ExportFunction.get_results_container')
+    def test_export_unsupported_format(self, mock_get_container):
+        # Arrange
+        req = func.HttpRequest(
+            method='GET',
+            body=b'',
+            url='/api/exportResults',
+            params={'format': 'csv'},
+            route_params={}
+        )
+
+        # Act
+        response = main(req)
+
+        # Assert
+        self.assertEqual(response.status_code, 400)
+        mock_get_container.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+import sys
+import os
+import io
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Add the parent directory to the path so we can import the function code
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from SharedCode.export_helpers import (
+    analysis_results_to_record_batch,
+    query_stored_analysis_results,
+    write_analysis_results,
+)
+
+def make_result(index, topics="['finance', 'business']"):
+    return {
+        "id": f"doc-{index}",
+        "documentName": f"document_{index}.txt",
+        "uploadTime": "2024-01-01T10:00:00",
+        "processingTime": "2024-01-01T10:00:05",
+        "analysisResult": {
+            "topics": topics,
+            "entities": "['quarterly earnings']",
+            "summary": "Summary",
+            "sentiment": "positive",
+            "confidence_score": 0.9
+        }
+    }
+
+class TestExportHelpers(unittest.TestCase):
+    def test_record_batch_has_list_columns(self):
+        # Arrange
+        items = [make_result(0), make_result(1, topics=["logistics"]), make_result(2, topics="a, b")]
+
+        # Act
+        batch = analysis_results_to_record_batch(items)
+
+        # Assert
+        self.assertEqual(batch.schema.field("topics").type, pa.list_(pa.string()))
+        self.assertEqual(batch.column("topics").to_pylist(), [["finance", "business"], ["logistics"], ["a", "b"]])
+        self.assertEqual(batch.column("entities").to_pylist()[0], ["quarterly earnings"])
+        self.assertEqual(batch.column("processingTime").to_pylist()[0], datetime(2024, 1, 1, 10, 0, 5))
+
+    def test_record_batch_with_malformed_stored_list(self):
+        # Arrange
+        items = [make_result(0, topics="{[]: 1}"), make_result(1, topics="[" * 100000)]
+
+        # Act
+        topics = analysis_results_to_record_batch(items).column("topics").to_pylist()
+
+        # Assert
+        self.assertEqual(topics[0], ["{[]: 1}"])
+        self.assertEqual(len(topics[1]), 1)
+
+    def test_record_batch_with_missing_fields(self):
+        # Arrange
+        items = [{"id": "doc-0", "uploadTime": "not a date"}]
+
+        # Act
+        row = analysis_results_to_record_batch(items).to_pylist()[0]
+
+        # Assert
+        self.assertIsNone(row["uploadTime"])
+        self.assertEqual(row["topics"], [])
+        self.assertEqual(row["sentiment"], "neutral")
+        self.assertEqual(row["confidence_score"], 0.0)
+
+    def test_write_parquet_in_row_groups(self):
+        # Arrange
+        items = (make_result(i) for i in range(5))
+        sink = io.BytesIO()
+
+        # Act
+        rows_written = write_analysis_results(items, sink, export_format="parquet", row_group_size=2)
+
+        # Assert
+        sink.seek(0)
+        parquet_file = pq.ParquetFile(sink)
+        self.assertEqual(rows_written, 5)
+        self.assertEqual(parquet_file.metadata.num_row_groups, 3)
+        self.assertEqual(parquet_file.read().column("id").to_pylist(), [f"doc-{i}" for i in range(5)])
+
+    def test_write_arrow_stream(self):
+        # Arrange
+        items = [make_result(i) for i in range(3)]
+        sink = io.BytesIO()
+
+        # Act
+        write_analysis_results(items, sink, export_format="arrow", row_group_size=2)
+
+        # Assert
+        sink.seek(0)
+        table = pa.ipc.open_stream(sink).read_all()
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(table.column("topics").to_pylist()[2], ["finance", "business"])
+
+    def test_write_rejects_unknown_format(self):
+        with self.assertRaises(ValueError):
+            write_analysis_results([], io.BytesIO(), export_format="csv")
+
+    def test_query_filters_by_time_range(self):
+        # Arrange
+        container = MagicMock()
+        start = datetime(2024, 1, 1)
+        end = datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+        # Act
+        query_stored_analysis_results(container, start=start, end=end, page_size=500)
+
+        # Assert
+        kwargs = container.query_items.call_args.kwargs
+        self.assertEqual(kwargs["query"], "SELECT * FROM c WHERE c.processingTime >= @start AND c.processingTime < @end")
+        self.assertEqual(kwargs["parameters"], [
+            {"name": "@start", "value": "2024-01-01T00:00:00"},
+            {"name": "@end", "value": "2024-02-01T00:00:00"}
+        ])
+        self.assertEqual(kwargs["max_item_count"], 500)
+
+if __name__ == '__main__':
+    unittest.main()
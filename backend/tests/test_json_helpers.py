@@ -5,7 +5,7 @@ import json
 
 # Add the parent directory to the path so we can import the function code
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from SharedCode.json_helpers import flatten_nested_json, transform_json_response
+from SharedCode.json_helpers import flatten_nested_json, transform_json_response, transform_json_responses
 
 class TestJsonHelpers(unittest.TestCase):
     def test_flatten_nested_json(self):
@@ -108,5 +108,22 @@ class TestJsonHelpers(unittest.TestCase):
         self.assertEqual(transformed["summary"], "['Point 1', 'Point 2']")
         self.assertEqual(transformed["sentiment"], "positive")
 
+    def test_transform_json_responses_batch(self):
+        # Arrange
+        responses = [
+            {"topics": ["finance"], "summary": "First", "sentiment": "positive"},
+            {"topics": "logistics,shipping", "summary": "Second"}
+        ]
+        
+        # Act
+        transformed = transform_json_responses(responses)
+        
+        # Assert
+        self.assertEqual(len(transformed), 2)
+        self.assertEqual(transformed[0]["topics"], ["finance"])
+        self.assertEqual(transformed[0]["sentiment"], "positive")
+        self.assertEqual(transformed[1]["topics"], ["logistics", "shipping"])
+        self.assertEqual(transformed[1]["sentiment"], "neutral")
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,131 @@
+import unittest
+import sys
+import os
+from typing import Annotated
+from pydantic import Field
+
+# Add the parent directory to the path so we can import the function code
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from SharedCode.schema_registry import AnalysisResultV1, CoercedList, SchemaRegistry
+
+class AnalysisResultV2(AnalysisResultV1):
+    keywords: Annotated[CoercedList, Field(default_factory=list)]
+
+class TestSchemaRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = SchemaRegistry()
+        self.registry.register(1, AnalysisResultV1)
+
+    def test_normalize_uses_latest_version(self):
+        # Arrange
+        self.registry.register(2, AnalysisResultV2)
+        response = {"topics": ["finance"], "keywords": "revenue, growth"}
+        
+        # Act
+        latest = self.registry.normalize(response)
+        original = self.registry.normalize(response, version=1)
+        
+        # Assert
+        self.assertEqual(self.registry.latest_version, 2)
+        self.assertEqual(latest["keywords"], ["revenue", "growth"])
+        self.assertNotIn("keywords", original)
+
+    def test_type_mismatch_falls_back_to_default_and_is_counted(self):
+        # Arrange
+        responses = [
+            {"topics": 42, "summary": None, "sentiment": "positive", "confidence": "high"},
+            {"topics": 7}
+        ]
+        
+        # Act
+        normalized = self.registry.normalize_batch(responses)
+        
+        # Assert
+        self.assertEqual(normalized[0]["topics"], [])
+        self.assertEqual(normalized[0]["summary"], "")
+        self.assertEqual(normalized[0]["sentiment"], "positive")
+        self.assertEqual(normalized[0]["confidence_score"], 0.0)
+        self.assertEqual(self.registry.failure_counts(), {
+            (1, "topics"): 2,
+            (1, "summary"): 1,
+            (1, "confidence_score"): 1
+        })
+
+    def test_numeric_confidence_is_coerced_to_float(self):
+        # Act
+        normalized = self.registry.normalize_batch([{"confidence": True}, {"confidence": 1}, {"confidence": 0.5}])
+        
+        # Assert
+        self.assertEqual([item["confidence_score"] for item in normalized], [1.0, 1.0, 0.5])
+        self.assertIsInstance(normalized[1]["confidence_score"], float)
+        self.assertEqual(self.registry.failure_counts(), {})
+
+    def test_mixed_batch_keeps_order(self):
+        # Arrange
+        responses = [{"summary": "first"}, {"topics": "a, b"}, None, {"summary": "last"}]
+        
+        # Act
+        normalized = self.registry.normalize_batch(responses)
+        
+        # Assert
+        self.assertEqual(normalized[0]["summary"], "first")
+        self.assertEqual(normalized[1]["topics"], ["a", "b"])
+        self.assertEqual(normalized[2]["summary"], "")
+        self.assertEqual(normalized[3]["summary"], "last")
+
+    def test_normalize_batch_accepts_any_iterable(self):
+        # Arrange
+        responses = ({"summary": "first"}, {"topics": 3})
+        
+        # Act
+        from_tuple = self.registry.normalize_batch(responses)
+        from_generator = self.registry.normalize_batch(response for response in responses)
+        
+        # Assert
+        self.assertEqual(from_tuple, from_generator)
+        self.assertEqual(from_tuple[0]["summary"], "first")
+        self.assertEqual(from_tuple[1]["topics"], [])
+
+    def test_normalize_single_response_repairs_and_counts(self):
+        # Act
+        normalized = self.registry.normalize({"topics": "a, b", "summary": 5, "confidence": "high"})
+        defaults = self.registry.normalize(None)
+        
+        # Assert
+        self.assertEqual(normalized["topics"], ["a", "b"])
+        self.assertEqual(normalized["summary"], "")
+        self.assertEqual(normalized["confidence_score"], 0.0)
+        self.assertEqual(defaults["sentiment"], "neutral")
+        self.assertEqual(self.registry.failure_counts(), {
+            (1, "summary"): 1,
+            (1, "confidence_score"): 1,
+            (1, "__root__"): 1
+        })
+
+    def test_non_object_response_uses_defaults(self):
+        # Act
+        normalized = self.registry.normalize_batch([None, "not json"])
+        
+        # Assert
+        self.assertEqual(normalized[0], normalized[1])
+        self.assertEqual(normalized[0]["sentiment"], "neutral")
+        self.assertEqual(self.registry.failure_counts(), {(1, "__root__"): 2})
+
+    def test_reset_failure_counts(self):
+        # Arrange
+        self.registry.normalize({"topics": 1})
+        
+        # Act
+        self.registry.reset_failure_counts()
+        
+        # Assert
+        self.assertEqual(self.registry.failure_counts(), {})
+
+    def test_duplicate_and_unknown_versions(self):
+        with self.assertRaises(ValueError):
+            self.registry.register(1, AnalysisResultV1)
+        with self.assertRaises(LookupError):
+            self.registry.normalize({}, version=3)
+
+if __name__ == '__main__':
+    unittest.main()